@@ -14,14 +14,24 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from validate_table import compress_findings, count_findings
+
+
+def format_rows(finding: dict) -> str:
+    """Format the row (or merged row range) of a finding"""
+    row_end = finding.get("row_end", finding["row"])
+    if row_end != finding["row"]:
+        return f"{finding['row']}–{row_end}"
+    return str(finding["row"])
+
 
 def generate_summary(results: dict) -> dict:
     """Generate summary statistics"""
     validation_results = results.get("validation_results", [])
     
     total_tables = len(validation_results)
-    total_errors = sum(len(r.get("errors", [])) for r in validation_results)
-    total_warnings = sum(len(r.get("warnings", [])) for r in validation_results)
+    total_errors = sum(count_findings(r.get("errors", [])) for r in validation_results)
+    total_warnings = sum(count_findings(r.get("warnings", [])) for r in validation_results)
     passed_tables = sum(1 for r in validation_results 
                        if not r.get("errors") and not r.get("warnings"))
     
@@ -43,12 +53,47 @@ def get_overall_status(summary: dict) -> tuple:
         return "✅ All Passed", "pass"
 
 
+def generate_estimate_lines(sample: dict) -> list:
+    """Generate the estimated (or, for fully validated tables, exact) failure rates"""
+    estimates = sample.get("estimates", [])
+    rows_total = sample.get("rows_total", 0)
+    
+    if sample.get("exact"):
+        lines = [f"**✅ Exact: all {rows_total} rows validated**", ""]
+        if estimates:
+            lines.extend([
+                "| Rule | Failing Rows | Failure Rate |",
+                "|------|--------------|--------------|"
+            ])
+            for est in estimates:
+                lines.append(
+                    f"| {est['rule_name']} | {est['failing_rows_in_sample']} | {est['failure_rate']:.1%} |"
+                )
+            lines.append("")
+        return lines
+    
+    lines = [f"**⚠️ Estimated from a sample of {sample.get('rows_sampled', 0)} of {rows_total} rows**", ""]
+    if estimates:
+        lines.extend([
+            "| Rule | Failing Rows in Sample | Est. Failure Rate | 95% CI | Est. Failing Rows |",
+            "|------|------------------------|-------------------|--------|-------------------|"
+        ])
+        for est in estimates:
+            lines.append(
+                f"| {est['rule_name']} | {est['failing_rows_in_sample']} / {est['rows_in_estimate']} "
+                f"| ~{est['failure_rate']:.1%} | {est['ci_low']:.1%} – {est['ci_high']:.1%} "
+                f"| ~{est['estimated_failing_rows']} |"
+            )
+        lines.append("")
+    return lines
+
+
 def generate_table_section(table_result: dict) -> str:
     """Generate report section for single table"""
     table_index = table_result.get("table_index", "?")
     headers = table_result.get("headers", [])
-    errors = table_result.get("errors", [])
-    warnings = table_result.get("warnings", [])
+    errors = compress_findings(table_result.get("errors", []))
+    warnings = compress_findings(table_result.get("warnings", []))
     matched_rules = table_result.get("matched_rules", "None")
     
     # Determine status icon
@@ -72,6 +117,9 @@ def generate_table_section(table_result: dict) -> str:
         ""
     ]
     
+    if table_result.get("sample"):
+        lines.extend(generate_estimate_lines(table_result["sample"]))
+    
     if errors or warnings:
         lines.extend([
             "| Row | Column | Rule | Issue | Severity |",
@@ -80,12 +128,12 @@ def generate_table_section(table_result: dict) -> str:
         
         for error in errors:
             lines.append(
-                f"| {error['row']} | {error['column']} | {error['rule_name']} | {error['message']} | ❌ Error |"
+                f"| {format_rows(error)} | {error['column']} | {error['rule_name']} | {error['message']} | ❌ Error |"
             )
         
         for warning in warnings:
             lines.append(
-                f"| {warning['row']} | {warning['column']} | {warning['rule_name']} | {warning['message']} | ⚠️ Warning |"
+                f"| {format_rows(warning)} | {warning['column']} | {warning['rule_name']} | {warning['message']} | ⚠️ Warning |"
             )
     else:
         lines.append("✅ All checks passed")
@@ -94,14 +142,16 @@ def generate_table_section(table_result: dict) -> str:
     return "\n".join(lines)
 
 
-def generate_report(results: dict) -> str:
-    """Generate complete report"""
+def generate_report(results: dict, sections: list = None) -> str:
+    """Generate complete report, reusing pre-rendered table sections if given"""
     source_file = results.get("source_file", "unknown.docx")
     chapter = results.get("chapter", "Not specified")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     summary = generate_summary(results)
     overall_status, _ = get_overall_status(summary)
+    sampled = results.get("sampled", False)
+    count_note = " (in sample)" if sampled else ""
     
     # Report header
     report_lines = [
@@ -111,6 +161,15 @@ def generate_report(results: dict) -> str:
         f"**Chapter**: {chapter}",
         f"**Validation Time**: {timestamp}",
         f"**Result**: {overall_status}",
+    ]
+    
+    if sampled:
+        report_lines.append(
+            f"**Mode**: ⚠️ Sampled triage ({results.get('sample_size')} rows per table) — "
+            "counts cover sampled rows only, failure rates are estimates"
+        )
+    
+    report_lines.extend([
         "",
         "---",
         "",
@@ -119,19 +178,20 @@ def generate_report(results: dict) -> str:
         "| Item | Count |",
         "|------|-------|",
         f"| Tables Validated | {summary['total_tables']} |",
-        f"| ❌ Errors | {summary['total_errors']} |",
-        f"| ⚠️ Warnings | {summary['total_warnings']} |",
+        f"| ❌ Errors{count_note} | {summary['total_errors']} |",
+        f"| ⚠️ Warnings{count_note} | {summary['total_warnings']} |",
         f"| ✅ Passed | {summary['passed_tables']} |",
         "",
         "---",
         "",
         "## 📑 Detailed Results",
         ""
-    ]
+    ])
     
     # Each table result
-    for table_result in results.get("validation_results", []):
-        report_lines.append(generate_table_section(table_result))
+    if sections is None:
+        sections = [generate_table_section(r) for r in results.get("validation_results", [])]
+    report_lines.extend(sections)
     
     # Report footer
     report_lines.extend([
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+rule_compiler.py - Compile parsed Markdown rules into specialized Python validators
+
+Each rule file parsed by validate_table.parse_markdown_rules() becomes a small
+Python module with the rule's columns, ids and messages baked in as constants.
+Compiled modules are cached on disk (keyed by a hash of the parsed rules) and
+imported directly on later runs.
+
+Usage:
+    python scripts/rule_compiler.py rules/table-required-fields.md   # print generated source
+
+    from rule_compiler import load_compiled_rules
+    module = load_compiled_rules(parsed_rules, cache_dir)
+    for rule_id, rule_name, rule_type, check in module.RULES:
+        findings = check(table)
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Bump when the generated code changes so cached modules are rebuilt
+COMPILER_VERSION = 1
+
+
+def rules_hash(parsed: dict) -> str:
+    """Hash of the parsed rules and compiler version"""
+    data = json.dumps({"version": COMPILER_VERSION, "rules": parsed}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _generate_not_empty(func_name: str, rule: dict) -> list:
+    """Generate a specialized not-empty check (same semantics as validate_not_empty)"""
+    columns = rule["config"].get("columns", [])
+    all_columns = not columns or columns == ["All columns"]
+    rule_id = rule.get("id", "not-empty")
+    rule_name = rule.get("name", "Required Fields")
+
+    lines = [
+        f"# {rule_id}: {rule_name} (not-empty)",
+        f"def {func_name}(table):",
+        "    findings = []",
+        '    headers = table.get("headers", [])',
+        '    table_index = table.get("index", 0)',
+    ]
+    if all_columns:
+        lines.append("    targets = [(headers.index(c), c) for c in headers]")
+    else:
+        lines.append(f"    targets = [(headers.index(c), c) for c in {tuple(columns)!r} if c in headers]")
+    lines.extend([
+        '    for row_idx, row in enumerate(table.get("rows", []), start=2):',
+        "        row_len = len(row)",
+        "        for col_idx, col_name in targets:",
+        "            if col_idx < row_len and not row[col_idx].strip():",
+        "                findings.append({",
+        '                    "table_index": table_index, "row": row_idx, "column": col_name,',
+        f'                    "rule_id": {rule_id!r}, "rule_name": {rule_name!r},',
+        '                    "message": "Field is empty", "severity": "error"',
+        "                })",
+        "    if findings:",
+        '        print(f"      Found {len(findings)} empty cell(s)")',
+        "    return findings",
+    ])
+    return lines
+
+
+# Rule types with a code generator; other types are not executed (as in validate_table.main)
+GENERATORS = {
+    "not-empty": _generate_not_empty,
+}
+
+
+def generate_source(parsed: dict) -> str:
+    """Generate Python source for one parsed rule file"""
+    source_file = parsed.get("source_file", "?")
+    lines = [
+        f"# Generated by rule_compiler.py from {source_file} - do not edit",
+        f"RULES_HASH = {rules_hash(parsed)!r}",
+        f"RULE_FILE_ID = {parsed.get('id')!r}",
+        "",
+    ]
+
+    entries = []
+    for i, rule in enumerate(parsed.get("rules", []), start=1):
+        generator = GENERATORS.get(rule["type"])
+        if not generator:
+            lines.append(f"# {rule['id']}: {rule['name']} ({rule['type']}) - no validator, skipped")
+            lines.append("")
+            continue
+        func_name = f"check_{i}"
+        lines.extend(generator(func_name, rule))
+        lines.extend(["", ""])
+        entries.append(f"    ({rule['id']!r}, {rule['name']!r}, {rule['type']!r}, {func_name}),")
+
+    lines.append("RULES = [")
+    lines.extend(entries)
+    lines.append("]")
+    return "\n".join(lines) + "\n"
+
+
+def load_compiled_rules(parsed: dict, cache_dir: str):
+    """Return the compiled module for a parsed rule file, generating it if not cached"""
+    cache_path = Path(cache_dir)
+    stem = Path(parsed.get("source_file") or "rules").stem.replace("-", "_")
+    module_path = cache_path / f"{stem}_{rules_hash(parsed)}.py"
+
+    if not module_path.exists():
+        cache_path.mkdir(parents=True, exist_ok=True)
+        # Drop stale modules compiled from older versions of this rule file;
+        # another process sharing the cache may have removed them already
+        for stale in cache_path.glob(f"{stem}_{'?' * 16}.py"):
+            if stale == module_path:
+                continue
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+        # Write to a temp file and move it into place so concurrent runs
+        # never import a half-written module
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path, prefix=f".{stem}_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(generate_source(parsed))
+            os.replace(tmp_path, module_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    spec = importlib.util.spec_from_file_location(f"compiled_rules.{module_path.stem}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except FileNotFoundError:
+        # Removed by a concurrent run compiling a different version of the rule file
+        exec(compile(generate_source(parsed), str(module_path), "exec"), module.__dict__)
+    return module
+
+
+def main():
+    """Print the generated source of the given rule files"""
+    if len(sys.argv) < 2:
+        print("Usage: python rule_compiler.py <rule_md> [<rule_md> ...]")
+        sys.exit(1)
+
+    from validate_table import parse_markdown_rules
+    for md_path in sys.argv[1:]:
+        md_file = Path(md_path)
+        parsed = parse_markdown_rules(md_file.read_text(encoding="utf-8"))
+        parsed["source_file"] = md_file.name
+        print(generate_source(parsed))
+
+
+if __name__ == "__main__":
+    main()
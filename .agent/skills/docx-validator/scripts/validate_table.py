@@ -8,11 +8,19 @@ import json
 import re
 import sys
 import os
+import math
+import random
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Optional, List
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
 
 @dataclass
 class ValidationError:
@@ -26,6 +34,126 @@ class ValidationError:
     severity: str  # "error" or "warning"
 
 
+# Regex engine for rule-supplied patterns: "re" (default, backtracking),
+# "re2" (linear-time, needs google-re2) or "regex" (enforces a match timeout)
+REGEX_ENGINES = ("re", "re2", "regex")
+# pip package providing each optional engine
+REGEX_ENGINE_PACKAGES = {"re2": "google-re2", "regex": "regex"}
+_regex_engine = "re"
+_regex_timeout = 1.0
+
+NESTED_QUANTIFIER = "nested quantifier may cause catastrophic backtracking"
+OVERLAPPING_ALTERNATION = "overlapping alternation inside a repeat may cause catastrophic backtracking"
+RE2_UNSUPPORTED = "backreferences/lookarounds are not supported by re2"
+
+
+def configure_regex_engine(engine: str = "re", timeout: float = 1.0):
+    """Select the engine used for rule-supplied regexes and reset match caches"""
+    global _regex_engine, _regex_timeout
+    if engine not in REGEX_ENGINES:
+        raise ValueError(f"Unknown regex engine: {engine}")
+    if engine == "re2":
+        import re2  # noqa: F401 - fail early if google-re2 is missing
+    elif engine == "regex":
+        import regex  # noqa: F401
+    _regex_engine = engine
+    _regex_timeout = timeout
+    _compile_rule_regex.cache_clear()
+    rule_regex_search.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _compile_rule_regex(pattern: str, ignore_case: bool):
+    if _regex_engine == "re2":
+        import re2
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        return re2.compile(pattern, options)
+    if _regex_engine == "regex":
+        import regex
+        return regex.compile(pattern, regex.IGNORECASE if ignore_case else 0)
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+@lru_cache(maxsize=4096)
+def rule_regex_search(pattern: str, text: str, ignore_case: bool = False) -> bool:
+    """
+    Search text with a rule-supplied regex using the configured engine.
+    Results are cached, so repeated headers and section titles are matched once.
+    Returns False for invalid patterns or when the match timeout is exceeded.
+    """
+    try:
+        compiled = _compile_rule_regex(pattern, ignore_case)
+        if _regex_engine == "regex":
+            return compiled.search(text, timeout=_regex_timeout) is not None
+        return compiled.search(text) is not None
+    except TimeoutError:
+        print(f"Warning: regex '{pattern}' timed out after {_regex_timeout}s")
+        return False
+    except Exception:
+        return False
+
+
+def _branches_overlap(branches: list) -> bool:
+    """True if alternatives can match the same text start (or nothing at all)"""
+    first_literals = set()
+    for branch in branches:
+        if branch.getwidth()[0] == 0:
+            return True
+        op, av = branch.data[0]
+        if op == sre_parse.LITERAL:
+            if av in first_literals:
+                return True
+            first_literals.add(av)
+    return False
+
+
+def _scan_regex(items, in_repeat: bool, problems: list):
+    """Walk a parsed regex and collect backtracking risks and re2-unsupported constructs"""
+    for op, av in items:
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, high, sub = av
+            # Only repeats that can match more than once and a variable number of times matter
+            if in_repeat and high == sre_parse.MAXREPEAT and NESTED_QUANTIFIER not in problems:
+                problems.append(NESTED_QUANTIFIER)
+            _scan_regex(sub, in_repeat or (high > 1 and low != high), problems)
+        elif op == sre_parse.BRANCH:
+            if in_repeat and _branches_overlap(av[1]) and OVERLAPPING_ALTERNATION not in problems:
+                problems.append(OVERLAPPING_ALTERNATION)
+            for branch in av[1]:
+                _scan_regex(branch, in_repeat, problems)
+        elif op == sre_parse.SUBPATTERN:
+            _scan_regex(av[-1], in_repeat, problems)
+        elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            if RE2_UNSUPPORTED not in problems:
+                problems.append(RE2_UNSUPPORTED)
+            _scan_regex(av[1], False, problems)
+        elif op in (sre_parse.GROUPREF, sre_parse.GROUPREF_EXISTS):
+            if RE2_UNSUPPORTED not in problems:
+                problems.append(RE2_UNSUPPORTED)
+
+
+def diagnose_pattern(pattern: str) -> List[str]:
+    """Return a list of problems found in a rule-supplied regex"""
+    problems = []
+    try:
+        parsed = sre_parse.parse(pattern)
+    except re.error as e:
+        return [f"invalid regex: {e}"]
+    _scan_regex(parsed, False, problems)
+    if _regex_engine == "re2":
+        # re2 cannot backtrack, but rejects lookarounds and backreferences
+        problems = [p for p in problems if p not in (NESTED_QUANTIFIER, OVERLAPPING_ALTERNATION)]
+    elif RE2_UNSUPPORTED in problems:
+        problems.remove(RE2_UNSUPPORTED)
+    if _regex_engine == "re2":
+        try:
+            _compile_rule_regex(pattern, False)
+        except Exception as e:
+            problems.append(f"re2 cannot compile pattern: {e}")
+    return problems
+
+
 def parse_markdown_rules(md_content: str) -> dict:
     """
     Parse Markdown format rule file with YAML frontmatter
@@ -34,7 +162,10 @@ def parse_markdown_rules(md_content: str) -> dict:
         "id": None,
         "title": None,
         "script": None,
-        "table_matcher": {"columns": [], "match_mode": "contains", "column_pattern": None, "section_pattern": None},
+        "order_sensitive": False,
+        "order_key": None,
+        "glossary_file": None,
+        "table_matcher": {"columns": [], "match_mode": "contains", "column_pattern": None, "section_pattern": None, "pattern": None},
         "rules": []
     }
     
@@ -47,6 +178,8 @@ def parse_markdown_rules(md_content: str) -> dict:
             result["id"] = fm.get("id")
             result["title"] = fm.get("title")
             result["script"] = fm.get("script")
+            result["order_sensitive"] = bool(fm.get("order-sensitive"))
+            result["order_key"] = fm.get("order-key")
         except:
             pass
             
@@ -121,6 +254,16 @@ def parse_markdown_rules(md_content: str) -> dict:
                     result["table_matcher"]["section_pattern"] = section_match.group(1)
                     in_columns_list = False
                 
+                glossary_match = re.match(r"^\s*glossary_file:\s*(\S+)", line_stripped)
+                if glossary_match:
+                    result["glossary_file"] = glossary_match.group(1).strip("'\"")
+                    in_columns_list = False
+                
+                content_pattern_match = re.match(r"^\s*pattern:\s*[\"'](.+?)[\"']\s*$", line_stripped)
+                if content_pattern_match:
+                    result["table_matcher"]["pattern"] = content_pattern_match.group(1)
+                    in_columns_list = False
+                
                 continue
             
             if not in_code_block and line_stripped.startswith('- '):
@@ -183,15 +326,25 @@ def parse_markdown_rules(md_content: str) -> dict:
     return result
 
 
+def load_rule_file(md_file: Path) -> dict:
+    """Parse a single rule file and report problematic regexes"""
+    content = md_file.read_text(encoding="utf-8")
+    parsed = parse_markdown_rules(content)
+    parsed["source_file"] = md_file.name
+    for key in ("column_pattern", "section_pattern", "pattern"):
+        pattern = parsed["table_matcher"].get(key)
+        if pattern:
+            for problem in diagnose_pattern(pattern):
+                print(f"Warning: {md_file.name} {key} '{pattern}': {problem}")
+    return parsed
+
+
 def load_rules_from_directory(rules_dir: str) -> list:
     rules_path = Path(rules_dir)
     all_rules = []
     for md_file in rules_path.glob("*.md"):
         if md_file.name.startswith('_'): continue
-        content = md_file.read_text(encoding="utf-8")
-        parsed = parse_markdown_rules(content)
-        parsed["source_file"] = md_file.name
-        all_rules.append(parsed)
+        all_rules.append(load_rule_file(md_file))
     return all_rules
 
 
@@ -214,18 +367,13 @@ def match_table_to_rules(table: dict, rules_list: list) -> List[dict]:
         # Match by column pattern
         pat_match = True
         if column_pattern:
-            try:
-                regex = re.compile(column_pattern)
-                pat_match = any(regex.search(h) for h in table_headers)
-            except: pat_match = False
+            pat_match = any(rule_regex_search(column_pattern, h) for h in table_headers)
         
         # Match by section
         sec_match = True
         if section_pattern:
-            try:
-                regex = re.compile(section_pattern, re.IGNORECASE)
-                sec_match = regex.search(chapter) or regex.search(section)
-            except: sec_match = False
+            sec_match = (rule_regex_search(section_pattern, chapter, True)
+                         or rule_regex_search(section_pattern, section, True))
             
         if col_match and pat_match and sec_match:
             if matcher_columns or column_pattern or section_pattern:
@@ -261,10 +409,13 @@ def run_external_validator(script_path: str, table: dict) -> list:
             for line in proc.stdout.strip().split('\n'):
                 if 'Row' in line and ':' in line:
                     msg = line.split(':', 1)[1].strip()
-                    # Optional: extract more details
+                    # "Row 4: ..." or "Row 4, Column X: ..."
+                    loc = re.search(r'Row (\d+)(?:, Column ([^:]+))?:', line)
                     errors.append(ValidationError(
                         table_index=table.get("index", 0),
-                        row=0, column="Unknown", rule_id="script", rule_name="External Script",
+                        row=int(loc.group(1)) if loc else 0,
+                        column=(loc.group(2) or "Unknown").strip() if loc else "Unknown",
+                        rule_id="script", rule_name="External Script",
                         message=msg, severity="error"
                     ))
     except Exception as e:
@@ -285,7 +436,6 @@ def validate_not_empty(table: dict, rule: dict) -> list:
                 if col_idx < len(row):
                     val = row[col_idx].strip()
                     if not val:
-                        print(f"      Found empty cell in {col_name} at row {row_idx}")
                         errors.append(ValidationError(
                             table_index=table.get("index", 0),
                             row=row_idx, column=col_name,
@@ -293,52 +443,378 @@ def validate_not_empty(table: dict, rule: dict) -> list:
                             rule_name=rule.get("name", "Required Fields"),
                             message="Field is empty", severity="error"
                         ))
+    if errors:
+        print(f"      Found {len(errors)} empty cell(s)")
     return errors
 
 
+def compress_findings(findings: list) -> list:
+    """
+    Merge findings with the same rule, column and message on consecutive rows
+    into a single entry covering rows "row".."row_end" ("count" findings).
+    """
+    compressed = []
+    open_runs = {}
+    for finding in findings:
+        key = (finding.get("table_index"), finding.get("rule_id"), finding.get("column"),
+               finding.get("message"), finding.get("severity"))
+        count = finding.get("count", 1)
+        row_end = finding.get("row_end", finding["row"])
+        run = open_runs.get(key)
+        if run and finding["row"] == run.get("row_end", run["row"]) + 1:
+            run["row_end"] = row_end
+            run["count"] = run.get("count", 1) + count
+            continue
+        run = dict(finding)
+        open_runs[key] = run
+        compressed.append(run)
+    return compressed
+
+
+def expand_findings(findings: list) -> list:
+    """
+    Expand merged row ranges back into one finding per row, in row order.
+    Findings on the same row keep the order of their merged entries, so
+    row-major output such as validate_not_empty's round-trips exactly.
+    """
+    expanded = []
+    for finding in findings:
+        single = {k: v for k, v in finding.items() if k not in ("row_end", "count")}
+        for row in range(finding["row"], finding.get("row_end", finding["row"]) + 1):
+            expanded.append(dict(single, row=row))
+    return sorted(expanded, key=lambda f: f["row"])
+
+
+def count_findings(findings: list) -> int:
+    """Count findings, including every row covered by merged ranges"""
+    return sum(f.get("count", 1) for f in findings)
+
+
+# Rows per window when sampling tables for order-sensitive rules
+ORDER_SENSITIVE_WINDOW = 5
+
+# Smallest --sample that leaves room for a random 2-row window next to the
+# forced first and last windows
+MIN_SAMPLE_SIZE = 6
+
+
+def reservoir_sample(items, k: int, rng: random.Random) -> list:
+    """Uniform sample of k items from an iterable (Algorithm R)"""
+    reservoir = []
+    for i, item in enumerate(items):
+        if i < k:
+            reservoir.append(item)
+        else:
+            j = rng.randint(0, i)
+            if j < k:
+                reservoir[j] = item
+    return reservoir
+
+
+def table_rng(seed: int, table: dict) -> random.Random:
+    """Random generator for sampling one table, independent of which other tables are validated"""
+    return random.Random(f"{seed}:{table.get('index')}")
+
+
+def sample_windows(total: int, size: int, window: int, rng: random.Random) -> tuple:
+    """
+    Split a sample of about `size` out of `total` positions into windows of
+    consecutive positions. The first and last windows are always included;
+    the rest are random, non-overlapping windows. The window shrinks to
+    size // 3 so at least one random window fits next to the forced ones.
+    
+    Returns (forced windows, random windows). Only random windows are
+    estimation units, so the forced ones do not bias estimates.
+    Requires total > size >= 3 * window.
+    """
+    window = max(1, min(window, size // 3))
+    k = size // window - 2
+    middle_starts = range(window, total - 2 * window + 1, window)
+    starts = reservoir_sample(middle_starts, k, rng)
+    forced = [list(range(window)), list(range(total - window, total))]
+    units = [list(range(start, start + window)) for start in sorted(starts)]
+    return forced, units
+
+
+def parse_order_value(value: str) -> Optional[float]:
+    """Parse a numeric order key cell, return None if unable to parse"""
+    try:
+        return float(value.strip().replace(',', '').replace(' ', ''))
+    except (AttributeError, ValueError):
+        return None
+
+
+def order_rows(table: dict, order_key: Optional[str]) -> List[int]:
+    """
+    Row indices sorted by the order key column from high to low (stable, as
+    the order-sensitive validators sort), rows without a numeric key last.
+    Without an order key (or matching column) the document order is kept.
+    """
+    rows = table.get("rows", [])
+    headers = [h.strip().lower() for h in table.get("headers", [])]
+    if not order_key or order_key.strip().lower() not in headers:
+        return list(range(len(rows)))
+    col = headers.index(order_key.strip().lower())
+    keyed, unkeyed = [], []
+    for i, row in enumerate(rows):
+        value = parse_order_value(row[col]) if col < len(row) else None
+        (unkeyed if value is None else keyed).append((value, i))
+    keyed.sort(key=lambda item: item[0], reverse=True)
+    return [i for _, i in keyed] + [i for _, i in unkeyed]
+
+
+def subset_table(table: dict, indices: List[int]) -> tuple:
+    """Return a copy of the table with only the given rows, and their original row numbers"""
+    rows = table.get("rows", [])
+    # Row 1 is the header
+    return dict(table, rows=[rows[i] for i in indices]), [i + 2 for i in indices]
+
+
+def remap_sampled_rows(findings: list, row_numbers: List[int]) -> list:
+    """Translate row numbers of the sampled table back to the original table"""
+    for finding in findings:
+        if 2 <= finding["row"] < len(row_numbers) + 2:
+            finding["row"] = row_numbers[finding["row"] - 2]
+    return findings
+
+
+def wilson_interval(failures: float, n: float, z: float = 1.96) -> tuple:
+    """95% Wilson score interval for a proportion"""
+    if n == 0:
+        return 0.0, 1.0
+    p = failures / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def cluster_interval(unit_failures: List[int], unit_sizes: List[int]) -> tuple:
+    """
+    95% interval for the failing-row rate of a sample of row windows.
+    Rows in a window are correlated, so the Wilson interval is computed on
+    the effective sample size (rows divided by the estimated design effect).
+    """
+    n = len(unit_sizes)
+    rows = sum(unit_sizes)
+    if rows == 0:
+        return 0.0, 1.0
+    rate = sum(unit_failures) / rows
+    design_effect = max(unit_sizes)  # Worst case when it cannot be estimated
+    if n > 1 and 0 < rate < 1:
+        mean_size = rows / n
+        cluster_var = sum((y - rate * m) ** 2 for y, m in zip(unit_failures, unit_sizes)) \
+            / (n - 1) / (n * mean_size ** 2)
+        design_effect = max(1.0, cluster_var / (rate * (1 - rate) / rows))
+    effective_n = rows / design_effect
+    return wilson_interval(rate * effective_n, effective_n)
+
+
+def estimate_failure_rates(findings: list, applied_rules: dict, units: List[List[int]],
+                           rows_total: int, exact: bool) -> list:
+    """Estimate the share of failing rows per rule from the findings on random sample units"""
+    failing = {rule_id: set() for rule_id in applied_rules}
+    for finding in findings:
+        # Script findings without a row number cannot be attributed to a sampled row
+        if finding["row"] == 0:
+            continue
+        failing.setdefault(finding["rule_id"], set()).add(finding["row"])
+    
+    unit_sizes = [len(unit) for unit in units]
+    rows_in_estimate = sum(unit_sizes)
+    if not rows_in_estimate:
+        return []  # No rows to estimate from
+    estimates = []
+    for rule_id, rows in failing.items():
+        unit_failures = [sum(1 for row in unit if row in rows) for unit in units]
+        failures = sum(unit_failures)
+        rate = failures / rows_in_estimate
+        if exact:
+            low, high = rate, rate  # Every row was validated
+        elif max(unit_sizes, default=1) == 1:
+            low, high = wilson_interval(failures, rows_in_estimate)
+        else:
+            low, high = cluster_interval(unit_failures, unit_sizes)
+        estimates.append({
+            "rule_id": rule_id,
+            "rule_name": applied_rules.get(rule_id, rule_id),
+            "failing_rows_in_sample": failures,
+            "rows_in_estimate": rows_in_estimate,
+            "failure_rate": round(rate, 4),
+            "ci_low": round(low, 4),
+            "ci_high": round(high, 4),
+            "estimated_failing_rows": round(rate * rows_total)
+        })
+    return estimates
+
+
+def run_rule_file(table: dict, rule_file: dict) -> tuple:
+    """Run one matched rule file against a table; return (findings, applied rules)"""
+    findings = []
+    applied_rules = {}
+    print(f"  Table {table.get('index')} matched {rule_file['source_file']}")
+    # Run external script if defined
+    if rule_file.get("script"):
+        ext_errors = run_external_validator(rule_file["script"], table)
+        applied_rules[rule_file.get("id") or "script"] = rule_file.get("title") or "Script"
+        for err in ext_errors:
+            err.rule_id = rule_file.get("id") or "script"
+            err.rule_name = rule_file.get("title") or "Script"
+            findings.append(asdict(err))
+    
+    # Run compiled validators
+    if rule_file.get("compiled"):
+        for rule_id, rule_name, rule_type, check in rule_file["compiled"].RULES:
+            print(f"    Running compiled rule: {rule_name} ({rule_type})")
+            applied_rules[rule_id] = rule_name
+            findings.extend(check(table))
+        return findings, applied_rules
+    
+    # Run internal validators
+    for rule in rule_file.get("rules", []):
+        print(f"    Running internal rule: {rule['name']} ({rule['type']})")
+        if rule["type"] == "not-empty":
+            errs = validate_not_empty(table, rule)
+            applied_rules[rule.get("id", "not-empty")] = rule.get("name", "Required Fields")
+            for e in errs: findings.append(asdict(e))
+    return findings, applied_rules
+
+
+def validate_single_table(table: dict, matched_rules: list, args, rng: random.Random) -> dict:
+    """Run the matched rule files against one table and return its result entry"""
+    table_result = {
+        "table_index": table.get("index"),
+        "section": table.get("section"),
+        "errors": [],
+        "warnings": []
+    }
+    
+    rows_total = len(table.get("rows", []))
+    if not args.sample or rows_total <= args.sample:
+        # Small tables are validated fully even with --sample; their rates are exact
+        units = [[i + 2] for i in range(rows_total)]
+        estimates = []
+        for rule_file in matched_rules:
+            findings, applied_rules = run_rule_file(table, rule_file)
+            table_result["errors"].extend(findings)
+            if args.sample:
+                estimates.extend(estimate_failure_rates(findings, applied_rules, units, rows_total, True))
+        if args.sample:
+            table_result["sample"] = {
+                "rows_total": rows_total,
+                "rows_sampled": rows_total,
+                "exact": True,
+                "estimates": estimates
+            }
+    else:
+        sampled_rows = set()
+        estimates = []
+        # Plain rules share one sample of single rows in document order
+        row_positions = None
+        for rule_file in matched_rules:
+            if rule_file.get("order_sensitive"):
+                # Order-sensitive rules run once per window of rows that are
+                # neighbours in order-key order, so compared pairs never cross
+                # windows. The first row of a window has no neighbour to be
+                # compared with, so it is left out of the estimate.
+                order = order_rows(table, rule_file.get("order_key"))
+                forced, units = sample_windows(rows_total, args.sample, ORDER_SENSITIVE_WINDOW, rng)
+                findings, applied_rules = [], {}
+                for window in forced + units:
+                    window_table, row_numbers = subset_table(table, [order[p] for p in window])
+                    window_findings, window_rules = run_rule_file(window_table, rule_file)
+                    findings.extend(remap_sampled_rows(window_findings, row_numbers))
+                    applied_rules.update(window_rules)
+                    sampled_rows.update(row_numbers)
+                unit_rows = [[order[p] + 2 for p in window[1:]] for window in units]
+            else:
+                if row_positions is None:
+                    row_positions = sample_windows(rows_total, args.sample, 1, rng)
+                forced, units = row_positions
+                indices = sorted(p for window in forced + units for p in window)
+                sampled, row_numbers = subset_table(table, indices)
+                findings, applied_rules = run_rule_file(sampled, rule_file)
+                remap_sampled_rows(findings, row_numbers)
+                sampled_rows.update(row_numbers)
+                unit_rows = [[p + 2 for p in window] for window in units]
+            
+            table_result["errors"].extend(findings)
+            estimates.extend(estimate_failure_rates(findings, applied_rules, unit_rows, rows_total, False))
+        
+        table_result["sample"] = {
+            "rows_total": rows_total,
+            "rows_sampled": len(sampled_rows),
+            "exact": False,
+            "estimates": estimates
+        }
+    
+    for key in ("errors", "warnings"):
+        table_result[key] = compress_findings(table_result[key])
+        if args.expand:
+            table_result[key] = expand_findings(table_result[key])
+    
+    return table_result
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("tables_json")
     parser.add_argument("--rules", "-r", required=True)
     parser.add_argument("--output", "-o")
+    parser.add_argument("--regex-engine", choices=REGEX_ENGINES, default="re",
+                        help="Engine for rule regexes: re2 is linear-time, regex enforces --regex-timeout")
+    parser.add_argument("--expand", action="store_true",
+                        help="Write one finding per row instead of merged row ranges")
+    parser.add_argument("--regex-timeout", type=float, default=1.0,
+                        help="Per-match time limit in seconds (regex engine only)")
+    parser.add_argument("--sample", type=int, metavar="N",
+                        help="Fast triage: validate a sample of N rows per table and estimate failure rates")
+    parser.add_argument("--compile", action="store_true",
+                        help="Run internal rules as compiled Python validators cached on disk")
+    parser.add_argument("--compiled-dir",
+                        help="Cache directory for compiled rules (default: <rules>/__compiled__)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --sample")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and re-validate only what is affected by each file change")
+    parser.add_argument("--report", help="With --watch, also keep this Markdown report up to date")
     args = parser.parse_args()
+    if args.sample is not None and args.sample < MIN_SAMPLE_SIZE:
+        parser.error(f"--sample must be at least {MIN_SAMPLE_SIZE}")
+    if args.report and not args.watch:
+        parser.error("--report requires --watch (use generate_report.py for a one-off report)")
+    
+    try:
+        configure_regex_engine(args.regex_engine, args.regex_timeout)
+    except ImportError:
+        package = REGEX_ENGINE_PACKAGES[args.regex_engine]
+        parser.error(f"--regex-engine {args.regex_engine} requires the {package} package "
+                     f"(pip install {package})")
+    if args.watch:
+        from watch_validate import IncrementalValidator
+        IncrementalValidator(args).run()
+        return
     
     tables_data = json.loads(Path(args.tables_json).read_text(encoding="utf-8"))
     rules_list = load_rules_from_directory(args.rules)
+    if args.compile:
+        from rule_compiler import load_compiled_rules
+        compiled_dir = args.compiled_dir or str(Path(args.rules) / "__compiled__")
+        for rule_file in rules_list:
+            rule_file["compiled"] = load_compiled_rules(rule_file, compiled_dir)
     
     results = {"source_file": tables_data.get("source_file"), "validation_results": []}
+    if args.sample:
+        results["sampled"] = True
+        results["sample_size"] = args.sample
     
     for table in tables_data.get("tables", []):
         matched_rules = match_table_to_rules(table, rules_list)
-        table_result = {
-            "table_index": table.get("index"),
-            "section": table.get("section"),
-            "errors": [],
-            "warnings": []
-        }
-        
-        for rule_file in matched_rules:
-            print(f"  Table {table.get('index')} matched {rule_file['source_file']}")
-            # Run external script if defined
-            if rule_file.get("script"):
-                ext_errors = run_external_validator(rule_file["script"], table)
-                for err in ext_errors:
-                    err.rule_id = rule_file.get("id") or "script"
-                    err.rule_name = rule_file.get("title") or "Script"
-                    table_result["errors"].append(asdict(err))
-            
-            # Run internal validators
-            for rule in rule_file.get("rules", []):
-                print(f"    Running internal rule: {rule['name']} ({rule['type']})")
-                if rule["type"] == "not-empty":
-                    errs = validate_not_empty(table, rule)
-                    for e in errs: table_result["errors"].append(asdict(e))
-        
-        results["validation_results"].append(table_result)
+        results["validation_results"].append(
+            validate_single_table(table, matched_rules, args, table_rng(args.seed, table)))
     
     if args.output:
         Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
-        total = sum(len(r["errors"]) for r in results["validation_results"])
+        total = sum(count_findings(r["errors"]) for r in results["validation_results"])
         print(f"Validation complete: {total} error(s)")
     else:
         print(json.dumps(results, indent=2))
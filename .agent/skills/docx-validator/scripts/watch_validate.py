@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+watch_validate.py - Incremental re-validation for validate_table.py --watch
+
+Watches the tables JSON, rules/, validators/ and glossary/terms.md. Every table
+keeps the set of files its result depends on (matched rule files, their
+validator scripts and glossary), so a change only re-validates the affected
+tables and re-renders their report sections.
+
+Usage:
+    python scripts/validate_table.py tables.json --rules rules/ -o results.json --report report.md --watch
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from validate_table import (
+    configure_regex_engine,
+    count_findings,
+    load_rule_file,
+    match_table_to_rules,
+    table_rng,
+    validate_single_table,
+)
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds between file checks
+POLL_INTERVAL = 0.2
+
+
+def table_hash(table: dict) -> str:
+    """Hash of a table's content, used to detect edited tables"""
+    data = json.dumps(table, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class IncrementalValidator:
+    """Keeps validation results and the table -> file dependency graph between changes"""
+
+    def __init__(self, args):
+        self.args = args
+        # validate_table is imported here as a separate module from the
+        # __main__ script, so its regex engine must be configured again
+        configure_regex_engine(args.regex_engine, args.regex_timeout)
+        self.tables_path = Path(args.tables_json).resolve()
+        self.rules_dir = Path(args.rules).resolve()
+        self.validators_dir = SKILL_DIR / "validators"
+        self.glossary_path = SKILL_DIR / "glossary" / "terms.md"
+        self.compiled_dir = args.compiled_dir or str(Path(args.rules) / "__compiled__")
+
+        self.source_file = None
+        self.rule_files = {}    # rule file path -> parsed rules
+        self.table_order = []   # table keys in document order
+        self.tables = {}        # table key -> table
+        self.table_hashes = {}  # table key -> content hash
+        self.results = {}       # table key -> table result
+        self.sections = {}      # table key -> rendered report section
+        self.deps = {}          # table key -> set of file paths the result depends on
+        self.mtimes = {}
+
+    # File monitoring
+
+    def scan(self) -> dict:
+        """Return modification times of all watched files"""
+        paths = [self.tables_path, self.glossary_path]
+        paths.extend(p for p in self.rules_dir.glob("*.md") if not p.name.startswith('_'))
+        paths.extend(self.validators_dir.glob("*.py"))
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path.resolve()] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                pass
+        return mtimes
+
+    def poll(self) -> set:
+        """Return watched files added, changed or removed since the last poll"""
+        current = self.scan()
+        changed = {p for p in current.keys() | self.mtimes.keys() if current.get(p) != self.mtimes.get(p)}
+        self.mtimes = current
+        return changed
+
+    # Loading
+
+    def load_rule(self, path: Path) -> set:
+        """(Re)load one rule file; return tables it matches now"""
+        if not path.exists():
+            self.rule_files.pop(path, None)
+            return set()
+        parsed = load_rule_file(path)
+        if self.args.compile:
+            from rule_compiler import load_compiled_rules
+            parsed["compiled"] = load_compiled_rules(parsed, self.compiled_dir)
+        self.rule_files[path] = parsed
+        return {key for key, table in self.tables.items() if match_table_to_rules(table, [parsed])}
+
+    def load_tables(self) -> set:
+        """Reload the tables JSON; return keys of new or edited tables"""
+        try:
+            data = json.loads(self.tables_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            # File may be half-written; the next save triggers another reload
+            print(f"Cannot read {self.tables_path.name}: {e}")
+            return set()
+
+        self.source_file = data.get("source_file")
+        dirty = set()
+        order = []
+        for position, table in enumerate(data.get("tables", [])):
+            key = table.get("index", position)
+            order.append(key)
+            digest = table_hash(table)
+            if self.table_hashes.get(key) != digest:
+                self.tables[key] = table
+                self.table_hashes[key] = digest
+                dirty.add(key)
+
+        for key in set(self.table_order) - set(order):
+            for store in (self.tables, self.table_hashes, self.results, self.sections, self.deps):
+                store.pop(key, None)
+        if order != self.table_order:
+            dirty.add(None)  # Table order or set changed: outputs need rewriting
+        self.table_order = order
+        return dirty
+
+    # Validation
+
+    def dependencies(self, matched_rules: list) -> set:
+        """Files a table result depends on"""
+        deps = set()
+        for rule_file in matched_rules:
+            deps.add((self.rules_dir / rule_file["source_file"]).resolve())
+            if rule_file.get("script"):
+                deps.add((SKILL_DIR / rule_file["script"]).resolve())
+            if rule_file.get("glossary_file"):
+                deps.add((SKILL_DIR / rule_file["glossary_file"]).resolve())
+        return deps
+
+    def revalidate(self, key):
+        """Re-run matching and validation for one table"""
+        table = self.tables[key]
+        matched = match_table_to_rules(table, list(self.rule_files.values()))
+        result = validate_single_table(table, matched, self.args, table_rng(self.args.seed, table))
+        self.results[key] = result
+        self.deps[key] = self.dependencies(matched)
+        if self.args.report:
+            from generate_report import generate_table_section
+            self.sections[key] = generate_table_section(result)
+
+    def write_outputs(self):
+        """Write results JSON and report from the cached per-table results"""
+        results = {
+            "source_file": self.source_file,
+            "validation_results": [self.results[key] for key in self.table_order]
+        }
+        if self.args.sample:
+            results["sampled"] = True
+            results["sample_size"] = self.args.sample
+
+        if self.args.output:
+            Path(self.args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        if self.args.report:
+            from generate_report import generate_report
+            sections = [self.sections[key] for key in self.table_order]
+            Path(self.args.report).write_text(generate_report(results, sections), encoding="utf-8")
+        return results
+
+    def update(self, changed: set):
+        """Re-validate the tables affected by the changed files"""
+        started = time.perf_counter()
+        dirty = set()
+        if self.tables_path in changed:
+            dirty |= self.load_tables()
+        for path in changed:
+            if path.parent == self.rules_dir and path.suffix == ".md":
+                dirty |= self.load_rule(path)
+        dirty |= {key for key, deps in self.deps.items() if deps & changed}
+
+        revalidated = [key for key in self.table_order if key in dirty]
+        for key in revalidated:
+            self.revalidate(key)
+        if not dirty:
+            return
+
+        results = self.write_outputs()
+        total = sum(count_findings(r["errors"]) for r in results["validation_results"])
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"Re-validated {len(revalidated)} of {len(self.table_order)} table(s) "
+              f"in {elapsed:.0f} ms: {total} error(s)")
+
+    def run(self):
+        """Validate everything once, then re-validate incrementally on changes"""
+        self.mtimes = self.scan()
+        for path in self.mtimes:
+            if path.parent == self.rules_dir and path.suffix == ".md":
+                self.load_rule(path)
+        self.load_tables()
+        for key in self.table_order:
+            self.revalidate(key)
+        results = self.write_outputs()
+        total = sum(count_findings(r["errors"]) for r in results["validation_results"])
+        print(f"Validation complete: {total} error(s)")
+        print("Watching for changes (Ctrl+C to stop)...")
+
+        try:
+            while True:
+                time.sleep(POLL_INTERVAL)
+                changed = self.poll()
+                if changed:
+                    self.update(changed)
+        except KeyboardInterrupt:
+            print("Stopped watching")
@@ -0,0 +1,50 @@
+"""
+Tests for load-time diagnostics of rule-supplied regexes
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import validate_table
+from validate_table import (
+    NESTED_QUANTIFIER,
+    OVERLAPPING_ALTERNATION,
+    RE2_UNSUPPORTED,
+    diagnose_pattern,
+)
+
+
+def test_safe_patterns_have_no_problems():
+    for pattern in [r'\d+°C', r'(ab{2})+', r'(a|b)+', r'(\d+)?x', r'Version:\s*\d+\.\d+(\.\d+)?']:
+        assert diagnose_pattern(pattern) == [], pattern
+
+
+def test_nested_quantifiers_are_reported():
+    for pattern in [r'(a+)+$', r'((a+))+', r'(\w*)*x']:
+        assert NESTED_QUANTIFIER in diagnose_pattern(pattern), pattern
+
+
+def test_overlapping_alternation_is_reported():
+    assert OVERLAPPING_ALTERNATION in diagnose_pattern(r'(a|aa)+$')
+
+
+def test_invalid_pattern_is_reported():
+    assert diagnose_pattern('[')[0].startswith("invalid regex")
+
+
+def test_lookarounds_only_reported_for_re2(monkeypatch):
+    assert diagnose_pattern(r'(?=x)a') == []
+    assert diagnose_pattern(r'(a)\1') == []
+    monkeypatch.setattr(validate_table, "_regex_engine", "re2")
+    monkeypatch.setattr(validate_table, "_compile_rule_regex", lambda pattern, ignore_case: None)
+    assert RE2_UNSUPPORTED in diagnose_pattern(r'(?=x)a')
+    assert RE2_UNSUPPORTED in diagnose_pattern(r'(a)\1')
+
+
+def test_backtracking_risks_not_reported_for_re2(monkeypatch):
+    monkeypatch.setattr(validate_table, "_regex_engine", "re2")
+    monkeypatch.setattr(validate_table, "_compile_rule_regex", lambda pattern, ignore_case: None)
+    assert diagnose_pattern(r'(a+)+$') == []
+    assert diagnose_pattern(r'(a|aa)+$') == []
@@ -0,0 +1,59 @@
+"""
+Tests for merging repeated findings into row ranges
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from dataclasses import asdict
+
+from validate_table import compress_findings, count_findings, expand_findings, validate_not_empty
+
+RULE = {"id": "rule-1", "name": "Required Fields", "config": {"columns": []}}
+
+
+def not_empty_findings(headers, rows):
+    table = {"index": 1, "headers": headers, "rows": rows}
+    return [asdict(e) for e in validate_not_empty(table, RULE)]
+
+
+def test_round_trip_on_not_empty_output():
+    rows = [["", "x"], ["", "x"], ["", ""], ["y", ""], ["", "x"]]
+    findings = not_empty_findings(["A", "B"], rows)
+    assert expand_findings(compress_findings(findings)) == findings
+
+
+def test_interleaved_columns_are_merged_per_column():
+    rows = [["", ""], ["", ""], ["", ""], ["x", ""]]
+    compressed = compress_findings(not_empty_findings(["A", "B"], rows))
+    assert [(f["column"], f["row"], f.get("row_end"), f.get("count")) for f in compressed] == [
+        ("A", 2, 4, 3),
+        ("B", 2, 5, 4),
+    ]
+
+
+def test_gaps_split_ranges_and_single_rows_stay_plain():
+    rows = [[""], [""], ["x"], [""]]
+    compressed = compress_findings(not_empty_findings(["A"], rows))
+    assert [(f["row"], f.get("row_end")) for f in compressed] == [(2, 3), (5, None)]
+    assert "count" not in compressed[1]
+
+
+def test_recompressing_merged_entries():
+    rows = [[""]] * 6
+    findings = not_empty_findings(["A"], rows)
+    first, second = compress_findings(findings[:3]), compress_findings(findings[3:])
+    merged = compress_findings(first + second)
+    assert len(merged) == 1
+    assert (merged[0]["row"], merged[0]["row_end"], merged[0]["count"]) == (2, 7, 6)
+    assert compress_findings(merged) == merged
+
+
+def test_count_findings_on_merged_input():
+    rows = [["", ""], ["", "x"], ["", ""]]
+    findings = not_empty_findings(["A", "B"], rows)
+    compressed = compress_findings(findings)
+    assert len(compressed) < len(findings)
+    assert count_findings(compressed) == count_findings(findings) == 5
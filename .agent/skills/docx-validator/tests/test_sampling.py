@@ -0,0 +1,117 @@
+"""
+Tests for --sample triage: sample windows, row remapping and failure-rate estimates
+"""
+
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from validate_table import (
+    cluster_interval,
+    estimate_failure_rates,
+    load_rule_file,
+    remap_sampled_rows,
+    sample_windows,
+    validate_single_table,
+    wilson_interval,
+)
+
+
+def test_sample_windows_force_first_and_last_rows():
+    forced, units = sample_windows(1000, 50, 1, random.Random(0))
+    assert forced == [[0], [999]]
+    assert len(units) == 48
+    assert all(0 < unit[0] < 999 for unit in units)
+
+
+def test_sample_windows_do_not_overlap():
+    forced, units = sample_windows(1000, 100, 5, random.Random(1))
+    positions = [p for window in forced + units for p in window]
+    assert len(positions) == len(set(positions)) == 100
+    assert all(window == list(range(window[0], window[0] + 5)) for window in forced + units)
+
+
+def test_small_sample_shrinks_window_to_keep_a_random_unit():
+    forced, units = sample_windows(1000, 6, 5, random.Random(2))
+    assert [len(w) for w in forced] == [2, 2]
+    assert len(units) == 1 and len(units[0]) == 2
+
+
+def test_remap_sampled_rows_to_original_numbers():
+    findings = [{"row": 2}, {"row": 4}, {"row": 0}]
+    remap_sampled_rows(findings, [2, 57, 1001])
+    assert [f["row"] for f in findings] == [2, 1001, 0]
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(0, 10)
+    assert low == 0.0 and round(high, 4) == 0.2775
+    low, high = wilson_interval(5, 10)
+    assert round(low, 4) == 0.2366 and round(high, 4) == 0.7634
+
+
+def test_cluster_interval_is_wider_for_clustered_failures():
+    # Failures packed into whole windows carry less information than spread ones
+    clustered = cluster_interval([5, 5, 0, 0, 0, 0, 0, 0, 0, 0], [5] * 10)
+    spread = wilson_interval(10, 50)
+    assert clustered[0] < spread[0] and clustered[1] > spread[1]
+
+
+def test_estimate_excludes_row_zero_and_counts_only_units():
+    findings = [
+        {"rule_id": "r", "row": 0},    # script finding without a row
+        {"rule_id": "r", "row": 2},    # forced row, not a unit
+        {"rule_id": "r", "row": 10},
+    ]
+    [estimate] = estimate_failure_rates(findings, {"r": "Rule"}, [[10], [11], [12], [13]], 100, False)
+    assert estimate["failing_rows_in_sample"] == 1
+    assert estimate["rows_in_estimate"] == 4
+    assert estimate["failure_rate"] == 0.25
+    assert estimate["estimated_failing_rows"] == 25
+
+
+def test_exact_estimate_has_no_interval():
+    units = [[2], [3], [4], [5]]
+    [estimate] = estimate_failure_rates([{"rule_id": "r", "row": 3}], {"r": "Rule"}, units, 4, True)
+    assert estimate["failure_rate"] == estimate["ci_low"] == estimate["ci_high"] == 0.25
+
+
+def test_no_estimate_without_rows():
+    assert estimate_failure_rates([], {"r": "Rule"}, [], 0, True) == []
+
+
+def temperature_table(rows_total: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(rows_total):
+        temperature = 3000 - i
+        celsius = 9000 + rng.random() if rng.random() < 0.1 else temperature - 1000
+        rows.append([str(temperature), str(celsius)])
+    rng.shuffle(rows)  # Document order differs from temperature order
+    return {"index": 1, "headers": ["Temperature", "Celsius Value"], "rows": rows}
+
+
+def test_order_sensitive_sample_findings_are_full_table_findings():
+    rule_file = load_rule_file(SKILL_DIR / "rules" / "table-temperature-descending.md")
+    rule_file["script"] = str(SKILL_DIR / rule_file["script"])
+    table = temperature_table(300, seed=4)
+
+    full = validate_single_table(table, [rule_file], SimpleNamespace(sample=None, expand=True), random.Random(0))
+    sampled = validate_single_table(table, [rule_file], SimpleNamespace(sample=40, expand=True), random.Random(0))
+
+    full_findings = {(f["row"], f["message"]) for f in full["errors"]}
+    sampled_findings = {(f["row"], f["message"]) for f in sampled["errors"]}
+    assert sampled_findings
+    assert sampled_findings <= full_findings
+    assert sampled["sample"]["estimates"][0]["rows_in_estimate"] == 6 * 4
+
+
+def test_table_rng_depends_only_on_seed_and_table():
+    from validate_table import table_rng
+    table = {"index": 3}
+    assert table_rng(7, table).random() == table_rng(7, dict(table)).random()
+    assert table_rng(7, table).random() != table_rng(7, {"index": 4}).random()